@@ -88,6 +88,7 @@ def get_imds(adc, eris=None):
         eris = adc.transform_integrals()
 
     eris_ovov = eris.ovov
+    t2_1 = adc.t2[0]
 
     # a-b block
     # Zeroth-order terms
@@ -101,13 +102,13 @@ def get_imds(adc, eris=None):
 
                 kd = kconserv[kl,ka,km]
                 # Second-order terms
-                t2_1_mla = adc.t2[0][km,kl,ka]
+                t2_1_mla = t2_1[km,kl,ka]
                 M_ab[ka] += 0.5 * 0.5 * \
                     lib.einsum('mlad,lbmd->ab',t2_1_mla, eris_ovov[kl,kb,km],optimize=True)
                 M_ab[ka] -= 0.5 * 0.5 * \
                     lib.einsum('mlad,ldmb->ab',t2_1_mla, eris_ovov[kl,kd,km],optimize=True)
 
-                t2_1_lma = adc.t2[0][kl,km,ka]
+                t2_1_lma = t2_1[kl,km,ka]
                 M_ab[ka] -= 0.5 * 0.5 * \
                     lib.einsum('lmad,lbmd->ab',t2_1_lma, eris_ovov[kl,kb,km],optimize=True)
                 M_ab[ka] -= 0.5 * \
@@ -116,7 +117,7 @@ def get_imds(adc, eris=None):
                     lib.einsum('lmad,ldmb->ab',t2_1_lma, eris_ovov[kl,kd,km],optimize=True)
                 del t2_1_lma
 
-                t2_1_lmb = adc.t2[0][kl,km,kb]
+                t2_1_lmb = t2_1[kl,km,kb]
                 M_ab[ka] -= 0.5 * 0.5 * \
                     lib.einsum('lmbd,lamd->ab',t2_1_lmb.conj(),
                                eris_ovov[kl,ka,km].conj(),optimize=True)
@@ -128,7 +129,7 @@ def get_imds(adc, eris=None):
                                eris_ovov[kl,kd,km].conj(),optimize=True)
                 del t2_1_lmb
 
-                t2_1_mlb = adc.t2[0][km,kl,kb]
+                t2_1_mlb = t2_1[km,kl,kb]
                 M_ab[ka] += 0.5 * 0.5 * \
                     lib.einsum('mlbd,lamd->ab',t2_1_mlb.conj(),
                                eris_ovov[kl,ka,km].conj(),optimize=True)
@@ -150,7 +151,7 @@ def get_imds(adc, eris=None):
             kb = ka
             for kl in range(nkpts):
 
-                if isinstance(eris.ovvv, type(None)):
+                if eris.ovvv is None:
                     chnk_size = adc.chnk_size
                     if chnk_size > nocc:
                         chnk_size = nocc
@@ -207,7 +208,6 @@ def get_imds(adc, eris=None):
                 for km in range(nkpts):
                     kd = kconserv[km,ka,kl]
 
-                    t2_1 = adc.t2[0]
                     t2_2_lma = adc.t2[1][kl,km,ka]
                     M_ab[ka] -= 0.5 * 0.5 * \
                         lib.einsum('lmad,lbmd->ab',t2_2_lma, eris_ovov[kl,kb,km],optimize=True)
@@ -316,7 +316,7 @@ def get_imds(adc, eris=None):
                 for kl in range(nkpts):
                     kf = kconserv[km,kl,ka]
                     temp_t2 = adc.imds.t2_1_vvvv[:]
-                    t2_1_mla = adc.t2[0][km,kl,ka]
+                    t2_1_mla = t2_1[km,kl,ka]
                     M_ab[ka] -= 0.5 * 0.25* \
                         lib.einsum('mlaf,mlbf->ab',t2_1_mla,
                                    temp_t2[km,kl,kb].conj(), optimize=True)
@@ -333,7 +333,7 @@ def get_imds(adc, eris=None):
                                                       t2_1_mla, temp_t2[km,kl,kb].conj(), optimize=True)
                     del t2_1_mla
 
-                    t2_1_lma = adc.t2[0][kl,km,ka]
+                    t2_1_lma = t2_1[kl,km,ka]
                     M_ab[ka] += 0.5 * 0.25* \
                         lib.einsum('lmaf,mlbf->ab',t2_1_lma,
                                    temp_t2[km,kl,kb].conj(), optimize=True)
@@ -349,7 +349,7 @@ def get_imds(adc, eris=None):
                     del t2_1_lma
 
                     kd = kconserv[km,ka,kl]
-                    t2_1_mlb = adc.t2[0][km,kl,kb]
+                    t2_1_mlb = t2_1[km,kl,kb]
                     M_ab[ka] -= 0.5 * 0.25* \
                         lib.einsum('mlad,mlbd->ab', temp_t2[km,
                                    kl,ka].conj(), t2_1_mlb, optimize=True)
@@ -367,7 +367,7 @@ def get_imds(adc, eris=None):
                                    kl,ka].conj(), t2_1_mlb, optimize=True)
                     del t2_1_mlb
 
-                    t2_1_lmb = adc.t2[0][kl,km,kb]
+                    t2_1_lmb = t2_1[kl,km,kb]
                     M_ab[ka] += 0.5 * 0.25* \
                         lib.einsum('mlad,lmbd->ab', temp_t2[km,
                                    kl,ka].conj(), t2_1_lmb, optimize=True)
@@ -387,7 +387,16 @@ def get_imds(adc, eris=None):
                     for kd in range(nkpts):
                         kf = kconserv[km,kd,kl]
                         ke = kconserv[kb,ka,kf]
-                        if isinstance(eris.vvvv, type(None)):
+                        # Both vvvv contractions share the same t2*t2 intermediate,
+                        # so it is formed once and each vvvv block is used once
+                        t2_1_d = t2_1[km,kl,kd] - t2_1[kl,km,kd].transpose(1,0,2,3)
+                        t2_1_e = t2_1[km,kl,ke] - t2_1[kl,km,ke].transpose(1,0,2,3)
+                        temp_fe  = 2.*lib.einsum('mlfd,mled->fe',t2_1[km,kl,kf],
+                                                 t2_1[km,kl,ke].conj(), optimize=True)
+                        temp_fe -= lib.einsum('mldf,mled->fe',t2_1_d, t2_1_e.conj(), optimize=True)
+                        del t2_1_d
+                        del t2_1_e
+                        if eris.vvvv is None:
                             chnk_size = adc.chnk_size
                             if chnk_size > nvir:
                                 chnk_size = nvir
@@ -396,60 +405,19 @@ def get_imds(adc, eris=None):
                                 eris_vvvv = dfadc.get_vvvv_df(
                                     adc, eris.Lvv[kb,ka], eris.Lvv[ke,kf], p, chnk_size)/nkpts
                                 k = eris_vvvv.shape[0]
-                                M_ab[ka,a:a+k] -= lib.einsum('mldf,mled,aebf->ab',t2_1[km,kl,kd],
-                                                             t2_1[km,kl,ke].conj(), eris_vvvv, optimize=True)
-                                M_ab[ka,a:a+k] += lib.einsum('mldf,lmed,aebf->ab',t2_1[km,kl,kd],
-                                                             t2_1[kl,km,ke].conj(), eris_vvvv, optimize=True)
-                                M_ab[ka,a:a+k] += lib.einsum('lmdf,mled,aebf->ab',t2_1[kl,km,kd],
-                                                             t2_1[km,kl,ke].conj(), eris_vvvv, optimize=True)
-                                M_ab[ka,a:a+k] -= lib.einsum('lmdf,lmed,aebf->ab',t2_1[kl,km,kd],
-                                                             t2_1[kl,km,ke].conj(), eris_vvvv, optimize=True)
-                                M_ab[ka,a:a+k] += 2.*lib.einsum(
-                                    'mlfd,mled,aebf->ab',t2_1[km,kl,kf], t2_1[km,kl,ke].conj(), eris_vvvv,
-                                    optimize=True)
+                                M_ab[ka,a:a+k] += lib.einsum('fe,aebf->ab',temp_fe, eris_vvvv, optimize=True)
                                 del eris_vvvv
 
                                 eris_vvvv = dfadc.get_vvvv_df(
                                     adc, eris.Lvv[kb,kf], eris.Lvv[ke,ka], p, chnk_size)/nkpts
-                                M_ab[ka,a:a+k] += 0.5*lib.einsum(
-                                    'mldf,mled,aefb->ab',t2_1[km,kl,kd], t2_1[km,kl,ke].conj(), eris_vvvv,
-                                    optimize=True)
-                                M_ab[ka,a:a+k] -= 0.5*lib.einsum(
-                                    'mldf,lmed,aefb->ab',t2_1[km,kl,kd], t2_1[kl,km,ke].conj(), eris_vvvv,
-                                    optimize=True)
-                                M_ab[ka,a:a+k] -= 0.5*lib.einsum(
-                                    'lmdf,mled,aefb->ab',t2_1[kl,km,kd], t2_1[km,kl,ke].conj(), eris_vvvv,
-                                    optimize=True)
-                                M_ab[ka,a:a+k] += 0.5*lib.einsum(
-                                    'lmdf,lmed,aefb->ab',t2_1[kl,km,kd], t2_1[kl,km,ke].conj(), eris_vvvv,
-                                    optimize=True)
-                                M_ab[ka,a:a+k] -= lib.einsum('mlfd,mled,aefb->ab',t2_1[km,kl,kf],
-                                                             t2_1[km,kl,ke].conj(), eris_vvvv, optimize=True)
+                                M_ab[ka,a:a+k] -= 0.5*lib.einsum('fe,aefb->ab',temp_fe, eris_vvvv, optimize=True)
                                 del eris_vvvv
                                 a += k
 
                         elif isinstance(eris.vvvv, np.ndarray):
                             eris_vvvv =  eris.vvvv
-                            M_ab[ka] -= lib.einsum('mldf,mled,aebf->ab',t2_1[km,kl,kd],
-                                                   t2_1[km,kl,ke].conj(), eris_vvvv[ka,ke,kb], optimize=True)
-                            M_ab[ka] += lib.einsum('mldf,lmed,aebf->ab',t2_1[km,kl,kd],
-                                                   t2_1[kl,km,ke].conj(), eris_vvvv[ka,ke,kb], optimize=True)
-                            M_ab[ka] += lib.einsum('lmdf,mled,aebf->ab',t2_1[kl,km,kd],
-                                                   t2_1[km,kl,ke].conj(), eris_vvvv[ka,ke,kb], optimize=True)
-                            M_ab[ka] -= lib.einsum('lmdf,lmed,aebf->ab',t2_1[kl,km,kd],
-                                                   t2_1[kl,km,ke].conj(), eris_vvvv[ka,ke,kb], optimize=True)
-                            M_ab[ka] += 2.*lib.einsum('mlfd,mled,aebf->ab',t2_1[km,kl,kf],
-                                                      t2_1[km,kl,ke].conj(), eris_vvvv[ka,ke,kb], optimize=True)
-                            M_ab[ka] += 0.5*lib.einsum('mldf,mled,aefb->ab',t2_1[km,kl,kd],
-                                                       t2_1[km,kl,ke].conj(), eris_vvvv[ka,ke,kf], optimize=True)
-                            M_ab[ka] -= 0.5*lib.einsum('mldf,lmed,aefb->ab',t2_1[km,kl,kd],
-                                                       t2_1[kl,km,ke].conj(), eris_vvvv[ka,ke,kf], optimize=True)
-                            M_ab[ka] -= 0.5*lib.einsum('lmdf,mled,aefb->ab',t2_1[kl,km,kd],
-                                                       t2_1[km,kl,ke].conj(), eris_vvvv[ka,ke,kf], optimize=True)
-                            M_ab[ka] += 0.5*lib.einsum('lmdf,lmed,aefb->ab',t2_1[kl,km,kd],
-                                                       t2_1[kl,km,ke].conj(), eris_vvvv[ka,ke,kf], optimize=True)
-                            M_ab[ka] -= lib.einsum('mlfd,mled,aefb->ab',t2_1[km,kl,kf],
-                                                   t2_1[km,kl,ke].conj(), eris_vvvv[ka,ke,kf], optimize=True)
+                            M_ab[ka] += lib.einsum('fe,aebf->ab',temp_fe, eris_vvvv[ka,ke,kb], optimize=True)
+                            M_ab[ka] -= 0.5*lib.einsum('fe,aefb->ab',temp_fe, eris_vvvv[ka,ke,kf], optimize=True)
                         else :
                             chnk_size = adc.chnk_size
                             if chnk_size > nvir:
@@ -458,35 +426,13 @@ def get_imds(adc, eris=None):
                             for p in range(0,nvir,chnk_size):
                                 eris_vvvv = eris.vvvv[kb,ke,ka,p:p+chnk_size]
                                 k = eris_vvvv.shape[0]
-                                M_ab[ka,a:a+k] -= lib.einsum('mldf,mled,aebf->ab',t2_1[km,kl,kd],
-                                                             t2_1[km,kl,ke].conj(), eris_vvvv, optimize=True)
-                                M_ab[ka,a:a+k] += lib.einsum('mldf,lmed,aebf->ab',t2_1[km,kl,kd],
-                                                             t2_1[kl,km,ke].conj(), eris_vvvv, optimize=True)
-                                M_ab[ka,a:a+k] += lib.einsum('lmdf,mled,aebf->ab',t2_1[kl,km,kd],
-                                                             t2_1[km,kl,ke].conj(), eris_vvvv, optimize=True)
-                                M_ab[ka,a:a+k] -= lib.einsum('lmdf,lmed,aebf->ab',t2_1[kl,km,kd],
-                                                             t2_1[kl,km,ke].conj(), eris_vvvv, optimize=True)
-                                M_ab[ka,a:a+k] += 2.*lib.einsum(
-                                    'mlfd,mled,aebf->ab',t2_1[km,kl,kf], t2_1[km,kl,ke].conj(), eris_vvvv,
-                                    optimize=True)
+                                M_ab[ka,a:a+k] += lib.einsum('fe,aebf->ab',temp_fe, eris_vvvv, optimize=True)
                                 del eris_vvvv
                                 eris_vvvv = eris.vvvv[ka,ke,kf,p:p+chnk_size]
-                                M_ab[ka,a:a+k] += 0.5*lib.einsum(
-                                    'mldf,mled,aefb->ab',t2_1[km,kl,kd], t2_1[km,kl,ke].conj(), eris_vvvv,
-                                    optimize=True)
-                                M_ab[ka,a:a+k] -= 0.5*lib.einsum(
-                                    'mldf,lmed,aefb->ab',t2_1[km,kl,kd], t2_1[kl,km,ke].conj(), eris_vvvv,
-                                    optimize=True)
-                                M_ab[ka,a:a+k] -= 0.5*lib.einsum(
-                                    'lmdf,mled,aefb->ab',t2_1[kl,km,kd], t2_1[km,kl,ke].conj(), eris_vvvv,
-                                    optimize=True)
-                                M_ab[ka,a:a+k] += 0.5*lib.einsum(
-                                    'lmdf,lmed,aefb->ab',t2_1[kl,km,kd], t2_1[kl,km,ke].conj(), eris_vvvv,
-                                    optimize=True)
-                                M_ab[ka,a:a+k] -= lib.einsum('mlfd,mled,aefb->ab',t2_1[km,kl,kf],
-                                                             t2_1[km,kl,ke].conj(), eris_vvvv, optimize=True)
+                                M_ab[ka,a:a+k] -= 0.5*lib.einsum('fe,aefb->ab',temp_fe, eris_vvvv, optimize=True)
                                 del eris_vvvv
                                 a += k
+                        del temp_fe
 
     cput0 = log.timer_debug1("Completed M_ab ADC(3) calculation", *cput0)
 
@@ -585,6 +531,26 @@ def matvec(adc, kshift, M_ab=None, eris=None):
     if M_ab is None:
         M_ab = adc.get_imds()
 
+    dtype = np.complex128
+    madelung = tools.madelung(adc.cell, adc.kpts)
+
+    # The permuted ovvo/oovv combination of the ADC(2)-x ajk - bil block does
+    # not depend on the trial vector. It is built once for all sigma calls
+    # only for in-core integrals that fit in memory, otherwise per block
+    eris_ovvo_oovv = None
+    if (method == "adc(2)-x" or method == "adc(3)"):
+        mem_now = lib.current_memory()[0]
+        mem_ovvo_oovv = nkpts**3 * nocc**2 * nvir**2 * 16 / 1e6
+        if (isinstance(eris.ovvo, np.ndarray) and isinstance(eris.oovv, np.ndarray)
+                and mem_ovvo_oovv + mem_now < adc.max_memory):
+            eris_ovvo_oovv = np.empty((nkpts,nkpts,nkpts,nocc,nocc,nvir,nvir), dtype=dtype)
+            for ki in range(nkpts):
+                for ky in range(nkpts):
+                    for kj in range(nkpts):
+                        kz = kconserv[ky,ki,kj]
+                        eris_ovvo_oovv[ki,ky,kj] = 2.*eris.ovvo[ki,ky,kz].transpose(0,3,2,1)
+                        eris_ovvo_oovv[ki,ky,kj] -= eris.oovv[ki,kj,kz]
+
     #Calculate sigma vector
     def sigma_(r):
         cput0 = (time.process_time(), time.time())
@@ -594,10 +560,7 @@ def matvec(adc, kshift, M_ab=None, eris=None):
         r2 = r[s_doubles:f_doubles]
 
         r2 = r2.reshape(nkpts,nkpts,nocc,nvir,nvir)
-        s2 = np.zeros((nkpts,nkpts,nocc,nvir,nvir), dtype=np.complex128)
-        cell = adc.cell
-        kpts = adc.kpts
-        madelung = tools.madelung(cell, kpts)
+        s2 = np.zeros((nkpts,nkpts,nocc,nvir,nvir), dtype=dtype)
 
 ############ ADC(2) ij block ############################
 
@@ -608,7 +571,7 @@ def matvec(adc, kshift, M_ab=None, eris=None):
         for kb in range(nkpts):
             for kc in range(nkpts):
                 ki = kconserv[kb,kshift, kc]
-                if isinstance(eris.ovvv, type(None)):
+                if eris.ovvv is None:
                     chnk_size = adc.chnk_size
                     if chnk_size > nocc:
                         chnk_size = nocc
@@ -657,38 +620,34 @@ def matvec(adc, kshift, M_ab=None, eris=None):
                         kw = kconserv[kx, kz, ky]
 
                         if isinstance(eris.vvvv, np.ndarray):
-                            eris_vvvv = eris.vvvv.reshape(nkpts,nkpts,nkpts,nvir*nvir,nvir*nvir)
-                            r2_1 = r2.reshape(nkpts,nkpts,nocc,nvir*nvir)
-                            s2[ki, kx] += np.dot(r2_1[ki,kw],eris_vvvv[kx,ky,
-                                                 kw].T.conj()).reshape(nocc,nvir,nvir)
-                        elif isinstance(eris.vvvv, type(None)):
+                            eris_vvvv = eris.vvvv[kx,ky,kw].reshape(nvir*nvir,nvir*nvir)
+                            lib.dot(r2[ki,kw].reshape(nocc,-1), eris_vvvv.T.conj(),
+                                    1, s2[ki,kx].reshape(nocc,-1), 1)
+                            del eris_vvvv
+                        elif eris.vvvv is None:
                             s2[ki,kx] += ea_contract_r_vvvv(adc,r2[ki,kw],eris.Lvv,kx,ky,kw)
                         else :
                             s2[ki,kx] += ea_contract_r_vvvv(adc,r2[ki,kw],eris.vvvv,kx,ky,kw)
                     for kj in range(nkpts):
+                        # kconserv[ky,ki,kj] == kconserv[kj,ki,ky], the repeated
+                        # ovvo/oovv terms are combined and contracted only once
                         kz = kconserv[ky,ki,kj]
-                        s2[ki,kx] -= 0.5*lib.einsum('iyzj,jzx->ixy',
-                                                    eris_ovvo[ki,ky,kz],r2[kj,kz],optimize=True)
-                        s2[ki,kx] += lib.einsum('iyzj,jxz->ixy',eris_ovvo[ki,
-                                                ky,kz],r2[kj,kx],optimize=True)
-                        s2[ki,kx] -= 0.5*lib.einsum('ijzy,jxz->ixy',
-                                                    eris_oovv[ki,kj,kz],r2[kj,kx],optimize=True)
+                        eris_ovvo_iyz = eris_ovvo[ki,ky,kz]
+                        s2[ki,kx] -= lib.einsum('iyzj,jzx->ixy',
+                                                eris_ovvo_iyz,r2[kj,kz],optimize=True)
+                        if eris_ovvo_oovv is None:
+                            eris_ijzy = 2.*eris_ovvo_iyz.transpose(0,3,2,1)
+                            eris_ijzy -= eris_oovv[ki,kj,kz]
+                        else:
+                            eris_ijzy = eris_ovvo_oovv[ki,ky,kj]
+                        s2[ki,kx] += lib.einsum('ijzy,jxz->ixy',
+                                                eris_ijzy,r2[kj,kx],optimize=True)
+                        del eris_ovvo_iyz
+                        del eris_ijzy
 
                         kz = kconserv[kj,ki,kx]
-                        s2[ki,kx] -=  0.5*lib.einsum('ijzx,jzy->ixy',
-                                                     eris_oovv[ki,kj,kz],r2[kj,kz],optimize=True)
-
-                        kw = kconserv[kj,ki,kx]
-                        s2[ki,kx] -=  0.5*lib.einsum('ijwx,jwy->ixy',
-                                                     eris_oovv[ki,kj,kw],r2[kj,kw],optimize=True)
-
-                        kw = kconserv[kj,ki,ky]
-                        s2[ki,kx] -= 0.5*lib.einsum('ijwy,jxw->ixy',
-                                                    eris_oovv[ki,kj,kw],r2[kj,kx],optimize=True)
-                        s2[ki,kx] += lib.einsum('iywj,jxw->ixy',eris_ovvo[ki,
-                                                ky,kw],r2[kj,kx],optimize=True)
-                        s2[ki,kx] -= 0.5*lib.einsum('iywj,jwx->ixy',
-                                                    eris_ovvo[ki,ky,kw],r2[kj,kw],optimize=True)
+                        s2[ki,kx] -= lib.einsum('ijzx,jzy->ixy',
+                                                eris_oovv[ki,kj,kz],r2[kj,kz],optimize=True)
 
             if adc.exxdiv is not None:
                 s2 += -madelung * r2
@@ -706,14 +665,14 @@ def matvec(adc, kshift, M_ab=None, eris=None):
 
                     for kl in range(nkpts):
                         km = kconserv[kw, kl, kz]
-                        t2_1_lmz = adc.t2[0][kl,km,kz]
+                        t2_1_lmz = t2_1[kl,km,kz]
                         ka = kconserv[km, kj, kl]
                         temp_1 =       lib.einsum('lmzw,jzw->jlm',t2_1_lmz,r2[kj,kz])
                         temp = 0.25 * lib.einsum('lmzw,jzw->jlm',t2_1_lmz,r2[kj,kz])
                         temp -= 0.25 * lib.einsum('lmzw,jwz->jlm',t2_1_lmz,r2[kj,kw])
                         del t2_1_lmz
 
-                        t2_1_mlz = adc.t2[0][km,kl,kz]
+                        t2_1_mlz = t2_1[km,kl,kz]
                         temp -= 0.25 * lib.einsum('mlzw,jzw->jlm',t2_1_mlz,r2[kj,kz])
                         temp += 0.25 * lib.einsum('mlzw,jwz->jlm',t2_1_mlz,r2[kj,kw])
                         del t2_1_mlz
@@ -742,7 +701,7 @@ def matvec(adc, kshift, M_ab=None, eris=None):
                     kj = kconserv[kz, kshift, kw]
                     for kl in range(nkpts):
                         kd = kconserv[kj, kw, kl]
-                        t2_1_jlw = adc.t2[0][kj,kl,kw]
+                        t2_1_jlw = t2_1[kj,kl,kw]
 
                         temp_s_a = lib.einsum('jlwd,jzw->lzd',t2_1_jlw,r2[kj,kz],optimize=True)
                         temp_s_a -= lib.einsum('jlwd,jwz->lzd',t2_1_jlw,r2[kj,kw],optimize=True)
@@ -752,7 +711,7 @@ def matvec(adc, kshift, M_ab=None, eris=None):
                         temp_t2_r2_1 += lib.einsum('jlwd,jzw->lzd',t2_1_jlw,r2[kj,kz],optimize=True)
                         del t2_1_jlw
 
-                        t2_1_ljw = adc.t2[0][kl,kj,kw]
+                        t2_1_ljw = t2_1[kl,kj,kw]
                         temp_s_a -= lib.einsum('ljwd,jzw->lzd',t2_1_ljw,r2[kj,kz],optimize=True)
                         temp_s_a += lib.einsum('ljwd,jwz->lzd',t2_1_ljw,r2[kj,kw],optimize=True)
                         temp_s_a += lib.einsum('ljdw,jzw->lzd',
@@ -763,7 +722,7 @@ def matvec(adc, kshift, M_ab=None, eris=None):
                         temp_t2_r2_4 = lib.einsum(
                             'jldw,jwz->lzd',t2_1[kj,kl,kd],r2[kj,kw], optimize=True)
 
-                        if isinstance(eris.ovvv, type(None)):
+                        if eris.ovvv is None:
                             chnk_size = adc.chnk_size
                             if chnk_size > nocc:
                                 chnk_size = nocc
@@ -812,7 +771,7 @@ def matvec(adc, kshift, M_ab=None, eris=None):
                     kj = kconserv[kz, kshift, kw]
                     for kl in range(nkpts):
                         kd = kconserv[kj, kz, kl]
-                        t2_1_jlz = adc.t2[0][kj,kl,kz]
+                        t2_1_jlz = t2_1[kj,kl,kz]
 
                         temp_s_a_1  =   -lib.einsum('jlzd,jwz->lwd',
                                                     t2_1_jlz,r2[kj,kw],optimize=True)
@@ -826,7 +785,7 @@ def matvec(adc, kshift, M_ab=None, eris=None):
                                                     t2_1_jlz,r2[kj,kw],optimize=True)
                         del t2_1_jlz
 
-                        t2_1_ljz = adc.t2[0][kl,kj,kz]
+                        t2_1_ljz = t2_1[kl,kj,kz]
                         temp_s_a_1 += lib.einsum('ljzd,jwz->lwd',t2_1_ljz,r2[kj,kw],optimize=True)
                         temp_s_a_1 -= lib.einsum('ljzd,jzw->lwd',t2_1_ljz,r2[kj,kz],optimize=True)
                         temp_s_a_1 -= lib.einsum('ljdz,jwz->lwd',
@@ -837,7 +796,7 @@ def matvec(adc, kshift, M_ab=None, eris=None):
                         temp_t2_r2_3 = -lib.einsum('ljzd,jzw->lwd',t2_1_ljz,r2[kj,kz],optimize=True)
                         del t2_1_ljz
 
-                        if isinstance(eris.ovvv, type(None)):
+                        if eris.ovvv is None:
                             chnk_size = adc.chnk_size
                             if chnk_size > nocc:
                                 chnk_size = nocc
@@ -887,57 +846,39 @@ def matvec(adc, kshift, M_ab=None, eris=None):
                 for ky in range(nkpts):
                     ki = kconserv[ky,kshift,kx]
                     for kl in range(nkpts):
-                        temp = np.zeros((nocc,nvir,nvir),dtype=eris.oooo.dtype)
-                        temp_1_1 = np.zeros((nocc,nvir,nvir),dtype=eris.oooo.dtype)
-                        temp_2_1 = np.zeros((nocc,nvir,nvir),dtype=eris.oooo.dtype)
-                        if isinstance(eris.ovvv, type(None)):
-                            chnk_size = adc.chnk_size
-                            if chnk_size > nocc:
-                                chnk_size = nocc
-                            a = 0
-                            for p in range(0,nocc,chnk_size):
-                                kd = kconserv[kl, kshift, kx]
-                                kb = kconserv[kl,kd,kx]
-
-                                eris_ovvv = dfadc.get_ovvv_df(
-                                    adc, eris.Lov[kl,kd], eris.Lvv[kx,kb], p,
-                                    chnk_size).reshape(-1,nvir,nvir,nvir)/nkpts
-                                k = eris_ovvv.shape[0]
-                                temp_1_1[a:a+k] += lib.einsum('ldxb,b->lxd',
-                                                              eris_ovvv,r1,optimize=True)
-                                temp_2_1[a:a+k] += lib.einsum('ldxb,b->lxd',
-                                                              eris_ovvv,r1,optimize=True)
-                                del eris_ovvv
-
-                                eris_ovvv = dfadc.get_ovvv_df(
-                                    adc, eris.Lov[kl,kb], eris.Lvv[kx,kd], p,
-                                    chnk_size).reshape(-1,nvir,nvir,nvir)/nkpts
-                                temp_1_1[a:a+k] -= lib.einsum('lbxd,b->lxd',
-                                                              eris_ovvv,r1,optimize=True)
-                                del eris_ovvv
+                        # temp_1_1 and temp_2_1 share their first term, which
+                        # is computed once as temp_2_1
+                        if eris.ovvv is None:
+                            # r1 is contracted with the DF factors directly, so
+                            # no ovvv block needs to be assembled for these terms
+                            kd = kconserv[kl, kshift, kx]
+                            kb = kconserv[kl,kd,kx]
+                            Lvv_r1 = lib.einsum('Lxb,b->Lx', eris.Lvv[kx,kb], r1, optimize=True)
+                            Lov_r1 = lib.einsum('Llb,b->Ll', eris.Lov[kl,kb], r1, optimize=True)
+                            temp_2_1 = lib.einsum('Lld,Lx->lxd', eris.Lov[kl,kd],
+                                                  Lvv_r1, optimize=True)/nkpts
+                            temp_1_1 = temp_2_1 - lib.einsum('Ll,Lxd->lxd', Lov_r1,
+                                                             eris.Lvv[kx,kd], optimize=True)/nkpts
 
-                                kd = kconserv[kl, kshift, ky]
-                                kb = kconserv[ky,kd,kl]
-                                eris_ovvv = dfadc.get_ovvv_df(
-                                    adc, eris.Lov[kl,kb], eris.Lvv[ky,kd], p,
-                                    chnk_size).reshape(-1,nvir,nvir,nvir)/nkpts
-                                temp[a:a+k] -= lib.einsum('lbyd,b->lyd', eris_ovvv,r1,optimize=True)
-                                del eris_ovvv
-                                a += k
+                            kd = kconserv[kl, kshift, ky]
+                            kb = kconserv[ky,kd,kl]
+                            Lov_r1 = lib.einsum('Llb,b->Ll', eris.Lov[kl,kb], r1, optimize=True)
+                            temp = -lib.einsum('Ll,Lyd->lyd', Lov_r1,
+                                               eris.Lvv[ky,kd], optimize=True)/nkpts
+                            del Lvv_r1
+                            del Lov_r1
                         else :
                             kd = kconserv[ki, ky, kl]
                             kb = kconserv[kl,kd,kx]
                             eris_ovvv = eris.ovvv[:]
-                            temp_1_1 += lib.einsum('ldxb,b->lxd',
-                                                   eris_ovvv[kl,kd,kx],r1,optimize=True)
-                            temp_1_1 -= lib.einsum('lbxd,b->lxd',
-                                                   eris_ovvv[kl,kb,kx],r1,optimize=True)
-                            temp_2_1 += lib.einsum('ldxb,b->lxd',
-                                                   eris_ovvv[kl,kd,kx],r1,optimize=True)
+                            temp_2_1 = lib.einsum('ldxb,b->lxd',
+                                                  eris_ovvv[kl,kd,kx],r1,optimize=True)
+                            temp_1_1 = temp_2_1 - lib.einsum('lbxd,b->lxd',
+                                                             eris_ovvv[kl,kb,kx],r1,optimize=True)
 
                             kd = kconserv[kl, kshift, ky]
                             kb = kconserv[ky,kd,kl]
-                            temp -= lib.einsum('lbyd,b->lyd', eris_ovvv[kl,kb,ky],r1,optimize=True)
+                            temp = -lib.einsum('lbyd,b->lyd', eris_ovvv[kl,kb,ky],r1,optimize=True)
                             del eris_ovvv
 
                         kd = kconserv[kl,ky,ki]
@@ -966,163 +907,150 @@ def matvec(adc, kshift, M_ab=None, eris=None):
     return sigma_
 
 
-def get_trans_moments(adc,kshift):
-
-    nmo  = adc.nmo
-    T = []
-    for orb in range(nmo):
-        T_a = get_trans_moments_orbital(adc,orb,kshift)
-        T.append(T_a)
-
-    T = np.array(T)
-    return T
-
-
-def get_trans_moments_orbital(adc, orb, kshift):
-
-    if adc.method not in ("adc(2)", "adc(2)-x", "adc(3)"):
-        raise NotImplementedError(adc.method)
+def _trans_moments_occ(adc, kshift):
 
     method = adc.method
     nkpts = adc.nkpts
     nocc = adc.nocc
     nvir = adc.nmo - adc.nocc
+    kconserv = adc.khelper.kconserv
     t2_1 = adc.t2[0]
 
-    idn_vir = np.identity(nvir)
-
-    T1 = np.zeros((nvir),dtype=np.complex128)
-    T2 = np.zeros((nkpts,nkpts,nocc,nvir,nvir), dtype=np.complex128)
+    # The leading index p of T1_occ and T2_occ runs over the occupied MOs
+    T1_occ = np.zeros((nocc,nvir), dtype=np.complex128)
+    T2_occ = np.zeros((nocc,nkpts,nkpts,nocc,nvir,nvir), dtype=np.complex128)
 
 ######## ADC(2) 1h part  ############################################
 
-    if orb < nocc:
+    if (adc.approx_trans_moments is False or adc.method == "adc(3)"):
+        t1_2 = adc.t1[0]
+        T1_occ -= t1_2[kshift]
 
-        if (adc.approx_trans_moments is False or adc.method == "adc(3)"):
-            t1_2 = adc.t1[0]
-            T1 -= t1_2[kshift][orb,:]
+    for kj in range(nkpts):
+        for ka in range(nkpts):
+            kb = kconserv[kj, ka, kshift]
+            ki = kconserv[ka, kj, kb]
+            T2_occ[:,kj,ka] -= t2_1[ki,kj,ka].conj()
+
+######### ADC(3) 2p-1h  part  ############################################
+
+    if (adc.method == "adc(2)-x" and adc.approx_trans_moments is False) or (adc.method == "adc(3)"):
+
+        t2_2 = adc.t2[1]
 
         for kj in range(nkpts):
             for ka in range(nkpts):
-                kb = adc.khelper.kconserv[kj, ka, kshift]
-                ki = adc.khelper.kconserv[ka, kj, kb]
+                kb = kconserv[kj, ka, kshift]
+                ki = kconserv[ka, kj, kb]
+                T2_occ[:,kj,ka] -= t2_2[ki,kj,ka]
 
-                t2_1_t= t2_1[ki,kj,ka].transpose(1,0,2,3)
-                T2[kj,ka] -= t2_1_t[:,orb,:,:].conj()
-
-    else:
+########### ADC(3) 1p part  ############################################
 
-        T1 += idn_vir[(orb-nocc), :]
+    if(method=='adc(3)'):
         for kk in range(nkpts):
             for kc in range(nkpts):
-                kl = adc.khelper.kconserv[kc, kk, kshift]
-                ka = adc.khelper.kconserv[kc, kl, kk]
-                T1 -= 0.25* \
-                    lib.einsum('klc,klac->a',t2_1[kk,kl,kshift][:,:,
-                               (orb-nocc),:], t2_1[kk,kl,ka].conj(), optimize=True)
-                T1 -= 0.25* \
-                    lib.einsum('lkc,lkac->a',t2_1[kl,kk,kshift][:,:,
-                               (orb-nocc),:], t2_1[kl,kk,ka].conj(), optimize=True)
-
-                T1 -= 0.25* \
-                    lib.einsum('klc,klac->a',t2_1[kk,kl,kshift][:,:,
-                               (orb-nocc),:], t2_1[kk,kl,ka].conj(), optimize=True)
-                T1 += 0.25* \
-                    lib.einsum('lkc,klac->a',t2_1[kl,kk,kshift][:,:,
-                               (orb-nocc),:], t2_1[kk,kl,ka].conj(), optimize=True)
-                T1 += 0.25* \
-                    lib.einsum('klc,lkac->a',t2_1[kk,kl,kshift][:,:,
-                               (orb-nocc),:], t2_1[kl,kk,ka].conj(), optimize=True)
-                T1 -= 0.25* \
-                    lib.einsum('lkc,lkac->a',t2_1[kl,kk,kshift][:,:,
-                               (orb-nocc),:], t2_1[kl,kk,ka].conj(), optimize=True)
+                ka = kconserv[kk, kc, kshift]
+                T1_occ += 0.5*lib.einsum('kpac,ck->pa',t2_1[kk,kshift,kc], t1_2[kc].T,optimize=True)
+                T1_occ -= 0.5*lib.einsum('pkac,ck->pa',t2_1[kshift,kk,ka], t1_2[kc].T,optimize=True)
+                T1_occ -= 0.5*lib.einsum('pkac,ck->pa',t2_1[kshift,kk,ka], t1_2[kc].T,optimize=True)
 
-######### ADC(3) 2p-1h  part  ############################################
+    # T2_occ[ki,ka] <- 2*T2_occ[ki,ka] - T2_occ[ki,kb]^T, with kb fixed by
+    # momentum conservation; all blocks are updated from the unmodified T2_occ
+    ki, ka = np.indices((nkpts,nkpts))
+    kb = kconserv[ki,ka,kshift]
+    T2_occ = 2.*T2_occ - T2_occ[:,ki,kb].transpose(0,1,2,3,5,4)
 
-    if (adc.method == "adc(2)-x" and adc.approx_trans_moments is False) or (adc.method == "adc(3)"):
+    return T1_occ, T2_occ
 
-        t2_2 = adc.t2[1]
 
-        if orb < nocc:
+def _trans_moments_vir(adc, kshift):
 
-            for kj in range(nkpts):
-                for ka in range(nkpts):
-                    kb = adc.khelper.kconserv[kj, ka, kshift]
-                    ki = adc.khelper.kconserv[ka, kj, kb]
+    method = adc.method
+    nkpts = adc.nkpts
+    nvir = adc.nmo - adc.nocc
+    kconserv = adc.khelper.kconserv
+    t2_1 = adc.t2[0]
 
-                    t2_2_t = t2_2[ki,kj,ka].conj().transpose(1,0,2,3)
+    # The leading index p of T1_vir runs over the virtual MOs
+    T1_vir = np.zeros((nvir,nvir), dtype=np.complex128)
 
-                    T2[kj,ka] -= t2_2_t[:,orb,:,:].conj()
+######## ADC(2) 1h part  ############################################
 
+    T1_vir += np.identity(nvir)
+    for kk in range(nkpts):
+        for kc in range(nkpts):
+            kl = kconserv[kc, kk, kshift]
+            ka = kconserv[kc, kl, kk]
+            T1_vir -= 0.25*lib.einsum('klpc,klac->pa',t2_1[kk,kl,kshift],
+                                      t2_1[kk,kl,ka].conj(), optimize=True)
+            T1_vir -= 0.25*lib.einsum('lkpc,lkac->pa',t2_1[kl,kk,kshift],
+                                      t2_1[kl,kk,ka].conj(), optimize=True)
+
+            T1_vir -= 0.25*lib.einsum('klpc,klac->pa',t2_1[kk,kl,kshift],
+                                      t2_1[kk,kl,ka].conj(), optimize=True)
+            T1_vir += 0.25*lib.einsum('lkpc,klac->pa',t2_1[kl,kk,kshift],
+                                      t2_1[kk,kl,ka].conj(), optimize=True)
+            T1_vir += 0.25*lib.einsum('klpc,lkac->pa',t2_1[kk,kl,kshift],
+                                      t2_1[kl,kk,ka].conj(), optimize=True)
+            T1_vir -= 0.25*lib.einsum('lkpc,lkac->pa',t2_1[kl,kk,kshift],
+                                      t2_1[kl,kk,ka].conj(), optimize=True)
 
 ########### ADC(3) 1p part  ############################################
 
     if(method=='adc(3)'):
-        if orb < nocc:
-            for kk in range(nkpts):
-                for kc in range(nkpts):
-                    ka = adc.khelper.kconserv[kk, kc, kshift]
-                    T1 += 0.5*lib.einsum('kac,ck->a',
-                                         t2_1[kk,kshift,kc][:,orb,:,:], t1_2[kc].T,optimize=True)
-                    T1 -= 0.5*lib.einsum('kac,ck->a',
-                                         t2_1[kshift,kk,ka][orb,:,:,:], t1_2[kc].T,optimize=True)
-                    T1 -= 0.5*lib.einsum('kac,ck->a',
-                                         t2_1[kshift,kk,ka][orb,:,:,:], t1_2[kc].T,optimize=True)
+        t2_2 = adc.t2[1]
+        for kk in range(nkpts):
+            for kc in range(nkpts):
+                kl = kconserv[kk, kc, kshift]
+                ka = kconserv[kl, kc, kk]
+
+                T1_vir -= 0.25*lib.einsum('klpc,klac->pa',t2_1[kk,kl,kshift],
+                                          t2_2[kk,kl,ka].conj(), optimize=True)
+                T1_vir -= 0.25*lib.einsum('lkpc,lkac->pa',t2_1[kl,kk,kshift],
+                                          t2_2[kl,kk,ka].conj(), optimize=True)
+                T1_vir -= 0.25*lib.einsum('klpc,klac->pa',t2_1[kk,kl,kshift],
+                                          t2_2[kk,kl,ka].conj(), optimize=True)
+                T1_vir += 0.25*lib.einsum('klpc,lkac->pa',t2_1[kk,kl,kshift],
+                                          t2_2[kl,kk,ka].conj(), optimize=True)
+                T1_vir += 0.25*lib.einsum('lkpc,klac->pa',t2_1[kl,kk,kshift],
+                                          t2_2[kk,kl,ka].conj(), optimize=True)
+                T1_vir -= 0.25*lib.einsum('lkpc,lkac->pa',t2_1[kl,kk,kshift],
+                                          t2_2[kl,kk,ka].conj(), optimize=True)
+
+                T1_vir -= 0.25*lib.einsum('klac,klpc->pa',t2_1[kk,kl,ka].conj(),
+                                          t2_2[kk,kl,kshift],optimize=True)
+                T1_vir -= 0.25*lib.einsum('lkac,lkpc->pa',t2_1[kl,kk,ka].conj(),
+                                          t2_2[kl,kk,kshift],optimize=True)
+                T1_vir -= 0.25*lib.einsum('klac,klpc->pa',t2_1[kk,kl,ka].conj(),
+                                          t2_2[kk,kl,kshift],optimize=True)
+                T1_vir += 0.25*lib.einsum('klac,lkpc->pa',t2_1[kk,kl,ka].conj(),
+                                          t2_2[kl,kk,kshift],optimize=True)
+                T1_vir += 0.25*lib.einsum('lkac,klpc->pa',t2_1[kl,kk,ka].conj(),
+                                          t2_2[kk,kl,kshift],optimize=True)
+                T1_vir -= 0.25*lib.einsum('lkac,lkpc->pa',t2_1[kl,kk,ka].conj(),
+                                          t2_2[kl,kk,kshift],optimize=True)
+
+    return T1_vir
 
-        else:
-            for kk in range(nkpts):
-                for kc in range(nkpts):
-                    kl = adc.khelper.kconserv[kk, kc, kshift]
-                    ka = adc.khelper.kconserv[kl, kc, kk]
-
-                    T1 -= 0.25* \
-                        lib.einsum('klc,klac->a',t2_1[kk,kl,kshift][:,:,
-                                   (orb-nocc),:], t2_2[kk,kl,ka].conj(), optimize=True)
-                    T1 -= 0.25* \
-                        lib.einsum('lkc,lkac->a',t2_1[kl,kk,kshift][:,:,
-                                   (orb-nocc),:], t2_2[kl,kk,ka].conj(), optimize=True)
-                    T1 -= 0.25* \
-                        lib.einsum('klc,klac->a',t2_1[kk,kl,kshift][:,:,
-                                   (orb-nocc),:], t2_2[kk,kl,ka].conj(), optimize=True)
-                    T1 += 0.25* \
-                        lib.einsum('klc,lkac->a',t2_1[kk,kl,kshift][:,:,
-                                   (orb-nocc),:], t2_2[kl,kk,ka].conj(), optimize=True)
-                    T1 += 0.25* \
-                        lib.einsum('lkc,klac->a',t2_1[kl,kk,kshift][:,:,
-                                   (orb-nocc),:], t2_2[kk,kl,ka].conj(), optimize=True)
-                    T1 -= 0.25* \
-                        lib.einsum('lkc,lkac->a',t2_1[kl,kk,kshift][:,:,
-                                   (orb-nocc),:], t2_2[kl,kk,ka].conj(), optimize=True)
-
-                    T1 -= 0.25* \
-                        lib.einsum('klac,klc->a',t2_1[kk,kl,ka].conj(),
-                                   t2_2[kk,kl,kshift][:,:,(orb-nocc),:],optimize=True)
-                    T1 -= 0.25* \
-                        lib.einsum('lkac,lkc->a',t2_1[kl,kk,ka].conj(),
-                                   t2_2[kl,kk,kshift][:,:,(orb-nocc),:],optimize=True)
-                    T1 -= 0.25* \
-                        lib.einsum('klac,klc->a',t2_1[kk,kl,ka].conj(),
-                                   t2_2[kk,kl,kshift][:,:,(orb-nocc),:],optimize=True)
-                    T1 += 0.25* \
-                        lib.einsum('klac,lkc->a',t2_1[kk,kl,ka].conj(),
-                                   t2_2[kl,kk,kshift][:,:,(orb-nocc),:],optimize=True)
-                    T1 += 0.25* \
-                        lib.einsum('lkac,klc->a',t2_1[kl,kk,ka].conj(),
-                                   t2_2[kk,kl,kshift][:,:,(orb-nocc),:],optimize=True)
-                    T1 -= 0.25* \
-                        lib.einsum('lkac,lkc->a',t2_1[kl,kk,ka].conj(),
-                                   t2_2[kl,kk,kshift][:,:,(orb-nocc),:],optimize=True)
-
-        del t2_2
-    del t2_1
 
-    for ka in range(nkpts):
-        for kb in range(nkpts):
-            ki = adc.khelper.kconserv[kb,kshift, ka]
-            T2[ki,ka] += T2[ki,ka] - T2[ki,kb].transpose(0,2,1)
+def get_trans_moments(adc,kshift):
+
+    if adc.method not in ("adc(2)", "adc(2)-x", "adc(3)"):
+        raise NotImplementedError(adc.method)
 
-    T2 = T2.reshape(-1)
-    T = np.hstack((T1,T2))
+    nocc = adc.nocc
+    nvir = adc.nmo - adc.nocc
+    nmo = adc.nmo
+
+    T1_occ, T2_occ = _trans_moments_occ(adc, kshift)
+    T1_vir = _trans_moments_vir(adc, kshift)
+
+    # Rows run over the MOs, occupied ones first; the virtual orbitals have
+    # no 2p-1h moments
+    T = np.zeros((nmo,nvir+T2_occ[0].size), dtype=np.complex128)
+    T[:nocc,:nvir] = T1_occ
+    T[:nocc,nvir:] = T2_occ.reshape(nocc,-1)
+    T[nocc:,:nvir] = T1_vir
 
     return T
 
@@ -1130,21 +1058,24 @@ def get_trans_moments_orbital(adc, orb, kshift):
 def renormalize_eigenvectors(adc, kshift, U, nroots=1):
 
     nkpts = adc.nkpts
+    kconserv = adc.khelper.kconserv
     nocc = adc.t2[0].shape[3]
     nvir = adc.nmo - adc.nocc
     n_singles = nvir
 
-    for I in range(U.shape[1]):
-        U1 = U[:n_singles,I]
-        U2 = U[n_singles:,I].reshape(nkpts,nkpts,nocc,nvir,nvir)
-        UdotU = np.dot(U1.conj().ravel(),U1.ravel())
-        for ka in range(nkpts):
-            for kb in range(nkpts):
-                ki = adc.khelper.kconserv[kb,kshift, ka]
-                UdotU +=  2.*np.dot(U2[ki,ka].conj().ravel(), U2[ki,ka].ravel()) - \
-                                    np.dot(U2[ki,ka].conj().ravel(),
-                                           U2[ki,kb].transpose(0,2,1).ravel())
-        U[:,I] /= np.sqrt(UdotU)
+    # (ki,ka) runs over all k-point pairs as (ka,kb) does, so the k-point
+    # sums are done with a single gathered contraction
+    ka, kb = np.indices((nkpts,nkpts))
+    ki = kconserv[kb,kshift,ka]
+
+    # All roots are normalized together; the trailing index I of U2 runs
+    # over the roots
+    U1 = U[:n_singles]
+    U2 = U[n_singles:].reshape(nkpts,nkpts,nocc,nvir,nvir,-1)
+    UdotU = np.einsum('pI,pI->I', U1.conj(), U1)
+    UdotU += 2.*np.einsum('xypqrI,xypqrI->I', U2.conj(), U2)
+    UdotU -= np.einsum('xypqrI,xypqrI->I', U2[ki,ka].conj(), U2[ki,kb].transpose(0,1,2,4,3,5))
+    U /= np.sqrt(UdotU)
 
     U = U.reshape(-1,nroots)
 
@@ -1268,15 +1199,12 @@ class RADCEA(kadc_rhf.RADC):
             idx = np.argsort(diag)
         else:
             idx = np.argsort(diag)[::-1]
-        guess = np.zeros((diag.shape[0], nroots), dtype=dtype)
+        # Each guess vector is a unit vector on one of the lowest (or highest)
+        # diagonal elements; set those entries directly
         min_shape = min(diag.shape[0], nroots)
-        guess[:min_shape,:min_shape] = np.identity(min_shape)
-        g = np.zeros((diag.shape[0], nroots), dtype=dtype)
-        g[idx] = guess.copy()
-        guess = []
-        for p in range(g.shape[1]):
-            guess.append(g[:,p])
-        return guess
+        guess = np.zeros((nroots, diag.shape[0]), dtype=dtype)
+        guess[np.arange(min_shape), idx[:min_shape]] = 1.0
+        return list(guess)
 
     def gen_matvec(self,kshift,imds=None, eris=None):
         if imds is None:
@@ -1295,7 +1223,7 @@ def ea_contract_r_vvvv(adc,r2,vvvv,ka,kb,kc):
 
     kd = kconserv[ka, kc, kb]
     r2 = np.ascontiguousarray(r2.reshape(nocc,-1))
-    r2_vvvv = np.zeros((nvir,nvir,nocc),dtype=r2.dtype)
+    r2_vvvv = np.empty((nocc,nvir,nvir),dtype=r2.dtype)
     chnk_size = adc.chnk_size
     if chnk_size > nvir:
         chnk_size = nvir
@@ -1308,17 +1236,16 @@ def ea_contract_r_vvvv(adc,r2,vvvv,ka,kb,kc):
             vvvv_p = dfadc.get_vvvv_df(adc, vv1, vv2, p, chnk_size)/nkpts
             k = vvvv_p.shape[0]
             vvvv_p = vvvv_p.reshape(-1,nvir*nvir)
-            r2_vvvv[a:a+k] += np.dot(vvvv_p.conj(),r2.T).reshape(-1,nvir,nocc)
+            r2_vvvv[:,a:a+k] = np.dot(r2,vvvv_p.T.conj()).reshape(nocc,-1,nvir)
             del vvvv_p
             a += k
     else :
         for p in range(0,nvir,chnk_size):
-            vvvv_p = vvvv[ka,kb,kc][p:p+chnk_size].reshape(-1,nvir*nvir)
+            vvvv_p = vvvv[ka,kb,kc][p:p+chnk_size]
             k = vvvv_p.shape[0]
-            r2_vvvv[a:a+k] += np.dot(vvvv_p.conj(),r2.T).reshape(-1,nvir,nocc)
+            vvvv_p = vvvv_p.reshape(-1,nvir*nvir)
+            r2_vvvv[:,a:a+k] = np.dot(r2,vvvv_p.T.conj()).reshape(nocc,-1,nvir)
             del vvvv_p
             a += k
 
-    r2_vvvv = np.ascontiguousarray(r2_vvvv.transpose(2,0,1))
-
     return r2_vvvv
@@ -99,8 +99,7 @@ def get_imds(adc, eris=None):
         for kl in range(nkpts):
             for kd in range(nkpts):
                 ke = kconserv[kj,kd,kl]
-                t2_1 = adc.t2[0]
-                t2_1_ild = adc.t2[0][ki,kl,kd]
+                t2_1_ild = t2_1[ki,kl,kd]
 
                 M_ij[ki] += 0.5 * 0.5 * \
                     lib.einsum('ilde,jdle->ij',t2_1_ild, eris_ovov[kj,kd,kl],optimize=True)
@@ -110,14 +109,14 @@ def get_imds(adc, eris=None):
                                              eris_ovov[kj,kd,kl],optimize=True)
                 del t2_1_ild
 
-                t2_1_lid = adc.t2[0][kl,ki,kd]
+                t2_1_lid = t2_1[kl,ki,kd]
                 M_ij[ki] -= 0.5 * 0.5 * \
                     lib.einsum('lide,jdle->ij',t2_1_lid, eris_ovov[kj,kd,kl],optimize=True)
                 M_ij[ki] += 0.5 * 0.5 * \
                     lib.einsum('lide,jeld->ij',t2_1_lid, eris_ovov[kj,ke,kl],optimize=True)
                 del t2_1_lid
 
-                t2_1_jld = adc.t2[0][kj,kl,kd]
+                t2_1_jld = t2_1[kj,kl,kd]
                 M_ij[ki] += 0.5 * 0.5 * \
                     lib.einsum('jlde,idle->ij',t2_1_jld.conj(),
                                eris_ovov[ki,kd,kl].conj(),optimize=True)
@@ -128,7 +127,7 @@ def get_imds(adc, eris=None):
                                              eris_ovov[ki,kd,kl].conj(),optimize=True)
                 del t2_1_jld
 
-                t2_1_ljd = adc.t2[0][kl,kj,kd]
+                t2_1_ljd = t2_1[kl,kj,kd]
                 M_ij[ki] -= 0.5 * 0.5 * \
                     lib.einsum('ljde,idle->ij',t2_1_ljd.conj(),
                                eris_ovov[ki,kd,kl].conj(),optimize=True)
@@ -136,7 +135,6 @@ def get_imds(adc, eris=None):
                     lib.einsum('ljde,ield->ij',t2_1_ljd.conj(),
                                eris_ovov[ki,ke,kl].conj(),optimize=True)
                 del t2_1_ljd
-                del t2_1
 
     cput0 = log.timer_debug1("Completed M_ij second-order terms ADC(2) calculation", *cput0)
     if (method == "adc(3)"):
@@ -162,8 +160,6 @@ def get_imds(adc, eris=None):
                                             eris_ovoo[ki,kd,kl].conj(),optimize=True)
 
                 for kd in range(nkpts):
-                    t2_1 = adc.t2[0]
-
                     ke = kconserv[kj,kd,kl]
                     t2_2_ild = adc.t2[1][ki,kl,kd]
                     M_ij[ki] += 0.5 * 0.5* \
@@ -199,8 +195,6 @@ def get_imds(adc, eris=None):
                                    eris_ovov[ki,ke,kl].conj(),optimize=True)
 
             for km, ke, kd in kpts_helper.loop_kkk(nkpts):
-                t2_1 = adc.t2[0]
-
                 kl = kconserv[kd,km,ke]
                 kf = kconserv[kj,kd,kl]
                 temp_t2_v_1 = lib.einsum(
@@ -305,7 +299,6 @@ def get_imds(adc, eris=None):
                 del temp_t2_v_11
 
             for km, ke, kd in kpts_helper.loop_kkk(nkpts):
-                t2_1 = adc.t2[0]
                 kl = kconserv[kd,km,ke]
                 kn = kconserv[kd,ki,ke]
                 temp_t2_v_12 = lib.einsum(
@@ -430,6 +423,21 @@ def get_diag(adc,kshift,M_ij=None,eris=None):
     return diag
 
 
+def _gather_blocks(eri, k1, k2, k3):
+    '''Stack the k-point blocks eri[k1,k2,k3] for k-point index arrays.
+
+    h5py datasets (t2_1, the outcore and DF integrals) do not support this
+    fancy indexing, their blocks are read one at a time.
+    '''
+    if isinstance(eri, np.ndarray):
+        return eri[k1,k2,k3]
+    k1, k2, k3 = np.broadcast_arrays(k1, k2, k3)
+    out = np.empty(k1.shape+eri.shape[3:], dtype=eri.dtype)
+    for idx in np.ndindex(*k1.shape):
+        out[idx] = eri[k1[idx],k2[idx],k3[idx]]
+    return out
+
+
 def matvec(adc, kshift, M_ij=None, eris=None):
 
     if adc.method not in ("adc(2)", "adc(2)-x", "adc(3)"):
@@ -462,6 +470,9 @@ def matvec(adc, kshift, M_ij=None, eris=None):
     if M_ij is None:
         M_ij = adc.get_imds()
 
+    dtype = np.complex128
+    madelung = tools.madelung(adc.cell, adc.kpts)
+
     #Calculate sigma vector
     def sigma_(r):
         cput0 = (time.process_time(), time.time())
@@ -471,10 +482,7 @@ def matvec(adc, kshift, M_ij=None, eris=None):
         r2 = r[s_doubles:f_doubles]
 
         r2 = r2.reshape(nkpts,nkpts,nvir,nocc,nocc)
-        s2 = np.zeros((nkpts,nkpts,nvir,nocc,nocc), dtype=np.complex128)
-        cell = adc.cell
-        kpts = adc.kpts
-        madelung = tools.madelung(cell, kpts)
+        s2 = np.zeros((nkpts,nkpts,nvir,nocc,nocc), dtype=dtype)
 
         eris_ovoo = eris.ovoo
 
@@ -483,15 +491,32 @@ def matvec(adc, kshift, M_ij=None, eris=None):
         s1 = lib.einsum('ij,j->i',M_ij[kshift],r1)
 
 ########### ADC(2) i - kja block #########################
+
+        if isinstance(eris_ovoo, np.ndarray):
+            # Reduced over all (kj,kk) pairs at once: the leading indices J,K
+            # of the gathered blocks run over kj and kk. h5py-backed ovoo
+            # (outcore, DF) is read one block at a time instead
+            kj, kk = np.indices((nkpts,nkpts))
+            ka = kconserv[kk, kshift, kj]
+            r2_ajk = r2[ka,kj]
+            s1 += 2. * lib.einsum('JKjaki,JKajk->i',
+                                  eris_ovoo[kj,ka,kk].conj(), r2_ajk, optimize=True)
+            s1 -= lib.einsum('JKkaji,JKajk->i',
+                             eris_ovoo[kk,ka,kj].conj(), r2_ajk, optimize=True)
+            del r2_ajk
+        else:
+            for kj in range(nkpts):
+                for kk in range(nkpts):
+                    ka = kconserv[kk, kshift, kj]
+                    s1 += 2. * lib.einsum('jaki,ajk->i',
+                                          eris_ovoo[kj,ka,kk].conj(), r2[ka,kj], optimize=True)
+                    s1 -= lib.einsum('kaji,ajk->i',
+                                     eris_ovoo[kk,ka,kj].conj(), r2[ka,kj], optimize=True)
+
         for kj in range(nkpts):
             for kk in range(nkpts):
                 ka = kconserv[kk, kshift, kj]
-                ki = kconserv[kj, kk, ka]
 
-                s1 += 2. * lib.einsum('jaki,ajk->i',
-                                      eris_ovoo[kj,ka,kk].conj(), r2[ka,kj], optimize=True)
-                s1 -= lib.einsum('kaji,ajk->i',
-                                 eris_ovoo[kk,ka,kj].conj(), r2[ka,kj], optimize=True)
 #################### ADC(2) ajk - i block ############################
 
                 s2[ka,kj] += lib.einsum('jaki,i->ajk', eris_ovoo[kj,ka,kk], r1, optimize=True)
@@ -513,13 +538,11 @@ def matvec(adc, kshift, M_ij=None, eris=None):
             for kj in range(nkpts):
                 for kk in range(nkpts):
                     ka = kconserv[kk, kshift, kj]
-                    for kl in range(nkpts):
-                        ki = kconserv[kj, kl, kk]
-
-                        s2[ka,kj] -= 0.5*lib.einsum('kijl,ali->ajk',
-                                                    eris_oooo[kk,ki,kj], r2[ka,kl], optimize=True)
-                        s2[ka,kj] -= 0.5*lib.einsum('klji,ail->ajk',
-                                                    eris_oooo[kk,kl,kj],r2[ka,ki], optimize=True)
+                    # The 'klji,ail->ajk' term equals the 'kijl,ali->ajk' term after
+                    # relabeling ki <-> kl. Both are contracted at once over all kl.
+                    kl = kconserv[kj,:,kk]
+                    s2[ka,kj] -= lib.einsum('Kkijl,Kali->ajk',
+                                            eris_oooo[kk,:,kj], r2[ka,kl], optimize=True)
 
                     for kl in range(nkpts):
                         kb = kconserv[ka, kk, kl]
@@ -554,7 +577,7 @@ def matvec(adc, kshift, M_ij=None, eris=None):
 
         if (method == "adc(3)"):
 
-            eris_ovoo = eris.ovoo
+            t2_1 = adc.t2[0]
 
 ################# ADC(3) i - kja block and ajk - i ############################
 
@@ -564,7 +587,6 @@ def matvec(adc, kshift, M_ij=None, eris=None):
 
                     for kb in range(nkpts):
                         kc = kconserv[kj,kb,kk]
-                        t2_1 = adc.t2[0]
                         temp_1 =       lib.einsum(
                             'jkbc,ajk->abc',t2_1[kj,kk,kb], r2[ka,kj], optimize=True)
                         temp  = 0.25 * lib.einsum('jkbc,ajk->abc',
@@ -576,7 +598,7 @@ def matvec(adc, kshift, M_ij=None, eris=None):
                         temp += 0.25 * lib.einsum('kjbc,akj->abc',
                                                   t2_1[kk,kj,kb], r2[ka,kk], optimize=True)
                         ki = kconserv[kc,ka,kb]
-                        if isinstance(eris.ovvv, type(None)):
+                        if eris.ovvv is None:
                             chnk_size = adc.chnk_size
                             if chnk_size > nocc:
                                 chnk_size = nocc
@@ -599,18 +621,17 @@ def matvec(adc, kshift, M_ij=None, eris=None):
                                 del eris_ovvv
                                 a += k
                         else :
-                            eris_ovvv = eris.ovvv[:]
+                            eris_ovvv = eris.ovvv[ki,kc,ka]
                             s1 += lib.einsum('abc,icab->i',temp_1,
-                                             eris_ovvv[ki,kc,ka], optimize=True)
+                                             eris_ovvv, optimize=True)
                             s1 += lib.einsum('abc,icab->i',temp,
-                                             eris_ovvv[ki,kc,ka], optimize=True)
+                                             eris_ovvv, optimize=True)
                             s1 -= lib.einsum('abc,ibac->i',temp,
-                                             eris_ovvv[ki,kb,ka], optimize=True)
+                                             eris.ovvv[ki,kb,ka], optimize=True)
                             del eris_ovvv
             del temp
             del temp_1
 
-            t2_1 = adc.t2[0]
 
             for kj in range(nkpts):
                 for kk in range(nkpts):
@@ -618,7 +639,7 @@ def matvec(adc, kshift, M_ij=None, eris=None):
                     for kc in range(nkpts):
                         kb = kconserv[kj, kc, kk]
                         ki = kconserv[kb,ka,kc]
-                        if isinstance(eris.ovvv, type(None)):
+                        if eris.ovvv is None:
                             chnk_size = adc.chnk_size
                             if chnk_size > nocc:
                                 chnk_size = nocc
@@ -634,82 +655,90 @@ def matvec(adc, kshift, M_ij=None, eris=None):
                                 del eris_ovvv
                                 a += k
                         else :
-                            eris_ovvv = eris.ovvv[:]
                             temp = lib.einsum(
-                                'i,icab->cba',r1,eris_ovvv[ki,kc,ka].conj(),optimize=True)
-                            del eris_ovvv
+                                'i,icab->cba',r1,eris.ovvv[ki,kc,ka].conj(),optimize=True)
                         s2[ka,kj] += lib.einsum('cba,jkbc->ajk',temp,
                                                 t2_1[kj,kk,kb].conj(), optimize=True)
             del temp
 
+            # The kb loops are vectorized: the leading index K of the gathered
+            # t2 and ovoo blocks below runs over all kb at once
+            kb = np.arange(nkpts)
             for kj in range(nkpts):
                 for kk in range(nkpts):
                     ka = kconserv[kj, kshift, kk]
-                    for kb in range(nkpts):
-                        kl = kconserv[ka, kj, kb]
-
-                        t2_1 = adc.t2[0]
-                        temp = lib.einsum('ljba,ajk->blk',t2_1[kl,kj,kb],r2[ka,kj],optimize=True)
-                        temp_2 = lib.einsum('jlba,akj->blk',t2_1[kj,kl,kb],r2[ka,kk], optimize=True)
-                        del t2_1
-
-                        t2_1_jla = adc.t2[0][kj,kl,ka]
-                        temp += lib.einsum('jlab,ajk->blk',t2_1_jla,r2[ka,kj],optimize=True)
-                        temp -= lib.einsum('jlab,akj->blk',t2_1_jla,r2[ka,kk],optimize=True)
-
-                        temp_1  = lib.einsum('jlab,ajk->blk',t2_1_jla,r2[ka,kj],optimize=True)
-                        temp_1 -= lib.einsum('jlab,akj->blk',t2_1_jla,r2[ka,kk],optimize=True)
-                        temp_1 += lib.einsum('jlab,ajk->blk',t2_1_jla,r2[ka,kj],optimize=True)
-                        del t2_1_jla
-
-                        t2_1_lja = adc.t2[0][kl,kj,ka]
-                        temp -= lib.einsum('ljab,ajk->blk',t2_1_lja,r2[ka,kj],optimize=True)
-                        temp += lib.einsum('ljab,akj->blk',t2_1_lja,r2[ka,kk],optimize=True)
-
-                        temp_1 -= lib.einsum('ljab,ajk->blk',t2_1_lja,r2[ka,kj],optimize=True)
-                        del t2_1_lja
-
-                        ki = kconserv[kk, kl, kb]
-                        s1 += 0.5*lib.einsum('blk,lbik->i',temp,  eris_ovoo[kl,kb,ki],optimize=True)
-                        s1 -= 0.5*lib.einsum('blk,iblk->i',temp,  eris_ovoo[ki,kb,kl],optimize=True)
-                        s1 += 0.5*lib.einsum('blk,lbik->i',temp_1,eris_ovoo[kl,kb,ki],optimize=True)
-                        s1 -= 0.5*lib.einsum('blk,iblk->i',temp_2,eris_ovoo[ki,kb,kl],optimize=True)
-                        del temp
-                        del temp_1
-                        del temp_2
-
-                    for kb in range(nkpts):
-                        kl = kconserv[ka, kk, kb]
-
-                        t2_1 = adc.t2[0]
-
-                        temp = -lib.einsum('lkba,akj->blj',t2_1[kl,kk,kb],r2[ka,kk],optimize=True)
-                        temp_2 = -lib.einsum('klba,ajk->blj',t2_1[kk,kl,kb],r2[ka,kj],optimize=True)
-                        del t2_1
-
-                        t2_1_kla = adc.t2[0][kk,kl,ka]
-                        temp -= lib.einsum('klab,akj->blj',t2_1_kla,r2[ka,kk],optimize=True)
-                        temp += lib.einsum('klab,ajk->blj',t2_1_kla,r2[ka,kj],optimize=True)
-                        temp_1  = -2.0 * lib.einsum('klab,akj->blj',
-                                                    t2_1_kla,r2[ka,kk],optimize=True)
-                        temp_1 += lib.einsum('klab,ajk->blj',t2_1_kla,r2[ka,kj],optimize=True)
-                        del t2_1_kla
-
-                        t2_1_lka = adc.t2[0][kl,kk,ka]
-                        temp += lib.einsum('lkab,akj->blj',t2_1_lka,r2[ka,kk],optimize=True)
-                        temp -= lib.einsum('lkab,ajk->blj',t2_1_lka,r2[ka,kj],optimize=True)
-                        temp_1 += lib.einsum('lkab,akj->blj',t2_1_lka,r2[ka,kk],optimize=True)
-                        del t2_1_lka
-
-                        ki = kconserv[kj, kl, kb]
-                        s1 -= 0.5*lib.einsum('blj,lbij->i',temp,  eris_ovoo[kl,kb,ki],optimize=True)
-                        s1 += 0.5*lib.einsum('blj,iblj->i',temp,  eris_ovoo[ki,kb,kl],optimize=True)
-                        s1 -= 0.5*lib.einsum('blj,lbij->i',temp_1,eris_ovoo[kl,kb,ki],optimize=True)
-                        s1 += 0.5*lib.einsum('blj,iblj->i',temp_2,eris_ovoo[ki,kb,kl],optimize=True)
-
-                        del temp
-                        del temp_1
-                        del temp_2
+                    r2_ajk = r2[ka,kj]
+                    r2_akj = r2[ka,kk]
+
+                    kl = kconserv[ka, kj, kb]
+                    t2_1_ljb = _gather_blocks(t2_1,kl,kj,kb)
+                    t2_1_jlb = _gather_blocks(t2_1,kj,kl,kb)
+                    temp = lib.einsum('Kljba,ajk->Kblk',t2_1_ljb,r2_ajk,optimize=True)
+                    temp_2 = lib.einsum('Kjlba,akj->Kblk',t2_1_jlb,r2_akj, optimize=True)
+                    del t2_1_ljb
+                    del t2_1_jlb
+
+                    # Each distinct contraction is evaluated once and
+                    # accumulated into temp and temp_1 with its net weight
+                    t2_1_jla = _gather_blocks(t2_1,kj,kl,ka)
+                    temp_a = lib.einsum('Kjlab,ajk->Kblk',t2_1_jla,r2_ajk,optimize=True)
+                    temp_b = lib.einsum('Kjlab,akj->Kblk',t2_1_jla,r2_akj,optimize=True)
+                    temp += temp_a - temp_b
+                    temp_1 = 2.0 * temp_a - temp_b
+                    del t2_1_jla
+
+                    t2_1_lja = _gather_blocks(t2_1,kl,kj,ka)
+                    temp_a = lib.einsum('Kljab,ajk->Kblk',t2_1_lja,r2_ajk,optimize=True)
+                    temp_b = lib.einsum('Kljab,akj->Kblk',t2_1_lja,r2_akj,optimize=True)
+                    temp -= temp_a - temp_b
+                    temp_1 -= temp_a
+                    del t2_1_lja
+
+                    ki = kconserv[kk, kl, kb]
+                    temp_1 += temp
+                    temp_2 += temp
+                    eris_ovoo_lbi = _gather_blocks(eris_ovoo,kl,kb,ki)
+                    eris_ovoo_ibl = _gather_blocks(eris_ovoo,ki,kb,kl)
+                    s1 += 0.5*lib.einsum('Kblk,Klbik->i',temp_1,eris_ovoo_lbi,optimize=True)
+                    s1 -= 0.5*lib.einsum('Kblk,Kiblk->i',temp_2,eris_ovoo_ibl,optimize=True)
+
+                    kl = kconserv[ka, kk, kb]
+                    t2_1_lkb = _gather_blocks(t2_1,kl,kk,kb)
+                    t2_1_klb = _gather_blocks(t2_1,kk,kl,kb)
+                    temp = -lib.einsum('Klkba,akj->Kblj',t2_1_lkb,r2_akj,optimize=True)
+                    temp_2 = -lib.einsum('Kklba,ajk->Kblj',t2_1_klb,r2_ajk,optimize=True)
+                    del t2_1_lkb
+                    del t2_1_klb
+
+                    t2_1_kla = _gather_blocks(t2_1,kk,kl,ka)
+                    temp_a = lib.einsum('Kklab,akj->Kblj',t2_1_kla,r2_akj,optimize=True)
+                    temp_b = lib.einsum('Kklab,ajk->Kblj',t2_1_kla,r2_ajk,optimize=True)
+                    temp -= temp_a - temp_b
+                    temp_1 = -2.0 * temp_a + temp_b
+                    del t2_1_kla
+
+                    t2_1_lka = _gather_blocks(t2_1,kl,kk,ka)
+                    temp_a = lib.einsum('Klkab,akj->Kblj',t2_1_lka,r2_akj,optimize=True)
+                    temp_b = lib.einsum('Klkab,ajk->Kblj',t2_1_lka,r2_ajk,optimize=True)
+                    temp += temp_a - temp_b
+                    temp_1 += temp_a
+                    del t2_1_lka
+                    del temp_a
+                    del temp_b
+
+                    ki = kconserv[kj, kl, kb]
+                    temp_1 += temp
+                    temp_2 += temp
+                    eris_ovoo_lbi = _gather_blocks(eris_ovoo,kl,kb,ki)
+                    eris_ovoo_ibl = _gather_blocks(eris_ovoo,ki,kb,kl)
+                    s1 -= 0.5*lib.einsum('Kblj,Klbij->i',temp_1,eris_ovoo_lbi,optimize=True)
+                    s1 += 0.5*lib.einsum('Kblj,Kiblj->i',temp_2,eris_ovoo_ibl,optimize=True)
+
+                    del eris_ovoo_lbi
+                    del eris_ovoo_ibl
+                    del temp
+                    del temp_1
+                    del temp_2
 
             for kj in range(nkpts):
                 for kk in range(nkpts):
@@ -719,12 +748,9 @@ def matvec(adc, kshift, M_ij=None, eris=None):
                         ki = kconserv[kk,kl,kb]
                         temp_1 = lib.einsum(
                             'i,lbik->kbl',r1,eris_ovoo[kl,kb,ki].conj(), optimize=True)
-                        temp  = lib.einsum(
-                            'i,lbik->kbl',r1,eris_ovoo[kl,kb,ki].conj(), optimize=True)
-                        temp -= lib.einsum('i,iblk->kbl',r1,
-                                           eris_ovoo[ki,kb,kl].conj(), optimize=True)
+                        temp = temp_1 - lib.einsum('i,iblk->kbl',r1,
+                                                   eris_ovoo[ki,kb,kl].conj(), optimize=True)
 
-                        t2_1 = adc.t2[0]
                         s2[ka,kj] += lib.einsum('kbl,ljba->ajk',temp,
                                                 t2_1[kl,kj,kb].conj(), optimize=True)
                         s2[ka,kj] += lib.einsum('kbl,jlab->ajk',temp_1,
@@ -738,7 +764,6 @@ def matvec(adc, kshift, M_ij=None, eris=None):
                                              eris_ovoo[ki,kb,kl].conj(), optimize=True)
                         s2[ka,kj] += lib.einsum('jbl,klba->ajk',temp_2,
                                                 t2_1[kk,kl,kb].conj(), optimize=True)
-                        del t2_1
         s2 = s2.reshape(-1)
         s = np.hstack((s1,s2))
         del s1
@@ -750,152 +775,149 @@ def matvec(adc, kshift, M_ij=None, eris=None):
     return sigma_
 
 
-def get_trans_moments(adc,kshift):
+def _trans_moments_occ(adc, kshift):
 
-    nmo  = adc.nmo
-    T = []
-    for orb in range(nmo):
-        T_a = get_trans_moments_orbital(adc,orb,kshift)
-        T.append(T_a)
+    method = adc.method
+    nkpts = adc.nkpts
+    nocc = adc.nocc
+    kconserv = adc.khelper.kconserv
+    t2_1 = adc.t2[0]
 
-    T = np.array(T)
-    return T
+    # The leading index p of T1_occ runs over the occupied MOs
+    T1_occ = np.zeros((nocc,nocc), dtype=np.complex128)
 
+######## ADC(2) 1h part  ############################################
 
-def get_trans_moments_orbital(adc, orb, kshift):
+    T1_occ += np.identity(nocc)
+    for kk in range(nkpts):
+        for kc in range(nkpts):
+            kd = kconserv[kk, kc, kshift]
+            ki = kconserv[kc, kk, kd]
+            T1_occ += 0.25*lib.einsum('kpdc,ikdc->pi',t2_1[kk,kshift,kd].conj(),
+                                      t2_1[ki,kk,kd], optimize=True)
+            T1_occ -= 0.25*lib.einsum('kpcd,ikdc->pi',t2_1[kk,kshift,kc].conj(),
+                                      t2_1[ki,kk,kd], optimize=True)
+            T1_occ -= 0.25*lib.einsum('kpdc,ikcd->pi',t2_1[kk,kshift,kd].conj(),
+                                      t2_1[ki,kk,kc], optimize=True)
+            T1_occ += 0.25*lib.einsum('kpcd,ikcd->pi',t2_1[kk,kshift,kc].conj(),
+                                      t2_1[ki,kk,kc], optimize=True)
+            T1_occ -= 0.25*lib.einsum('pkdc,ikdc->pi',t2_1[kshift,kk,kd].conj(),
+                                      t2_1[ki,kk,kd], optimize=True)
+            T1_occ -= 0.25*lib.einsum('pkcd,ikcd->pi',t2_1[kshift,kk,kc].conj(),
+                                      t2_1[ki,kk,kc], optimize=True)
 
-    if adc.method not in ("adc(2)", "adc(2)-x", "adc(3)"):
-        raise NotImplementedError(adc.method)
+######### ADC(3) 1h part  ############################################
+
+    if(method=='adc(3)'):
+        t2_2 = adc.t2[1]
+        for kk in range(nkpts):
+            for kc in range(nkpts):
+                kd = kconserv[kk, kc, kshift]
+                ki = kconserv[kd, kk, kc]
+                T1_occ += 0.25*lib.einsum('kpdc,ikdc->pi',t2_1[kk,ki,kd].conj(),
+                                          t2_2[ki,kk,kd], optimize=True)
+                T1_occ -= 0.25*lib.einsum('kpcd,ikdc->pi',t2_1[kk,ki,kc].conj(),
+                                          t2_2[ki,kk,kd], optimize=True)
+                T1_occ -= 0.25*lib.einsum('kpdc,ikcd->pi',t2_1[kk,ki,kd].conj(),
+                                          t2_2[ki,kk,kc], optimize=True)
+                T1_occ += 0.25*lib.einsum('kpcd,ikcd->pi',t2_1[kk,ki,kc].conj(),
+                                          t2_2[ki,kk,kc], optimize=True)
+                T1_occ -= 0.25*lib.einsum('pkdc,ikdc->pi',t2_1[ki,kk,kd].conj(),
+                                          t2_2[ki,kk,kd], optimize=True)
+                T1_occ -= 0.25*lib.einsum('pkcd,ikcd->pi',t2_1[ki,kk,kc].conj(),
+                                          t2_2[ki,kk,kc], optimize=True)
+
+                T1_occ += 0.25*lib.einsum('ikdc,kpdc->pi',t2_1[ki,kk,kd],
+                                          t2_2[kk,ki,kd].conj(), optimize=True)
+                T1_occ -= 0.25*lib.einsum('ikcd,kpdc->pi',t2_1[ki,kk,kc],
+                                          t2_2[kk,ki,kd].conj(), optimize=True)
+                T1_occ -= 0.25*lib.einsum('ikdc,kpcd->pi',t2_1[ki,kk,kd],
+                                          t2_2[kk,ki,kc].conj(), optimize=True)
+                T1_occ += 0.25*lib.einsum('ikcd,kpcd->pi',t2_1[ki,kk,kc],
+                                          t2_2[kk,ki,kc].conj(), optimize=True)
+                T1_occ -= 0.25*lib.einsum('ikcd,pkcd->pi',t2_1[ki,kk,kc],
+                                          t2_2[ki,kk,kc].conj(), optimize=True)
+                T1_occ -= 0.25*lib.einsum('ikdc,pkdc->pi',t2_1[ki,kk,kd],
+                                          t2_2[ki,kk,kd].conj(), optimize=True)
+
+    return T1_occ
+
+
+def _trans_moments_vir(adc, kshift):
 
     method = adc.method
     nkpts = adc.nkpts
     nocc = adc.nocc
     nvir = adc.nmo - adc.nocc
+    kconserv = adc.khelper.kconserv
     t2_1 = adc.t2[0]
 
-    idn_occ = np.identity(nocc)
-
-    T1 = np.zeros((nocc), dtype=np.complex128)
-    T2 = np.zeros((nkpts,nkpts,nvir,nocc,nocc), dtype=np.complex128)
+    # The leading index p of T1_vir and T2_vir runs over the virtual MOs
+    T1_vir = np.zeros((nvir,nocc), dtype=np.complex128)
+    T2_vir = np.zeros((nvir,nkpts,nkpts,nvir,nocc,nocc), dtype=np.complex128)
 
 ######## ADC(2) 1h part  ############################################
 
-    if orb < nocc:
-        T1 += idn_occ[orb, :]
-        for kk in range(nkpts):
-            for kc in range(nkpts):
-                kd = adc.khelper.kconserv[kk, kc, kshift]
-                ki = adc.khelper.kconserv[kc, kk, kd]
-                T1 += 0.25*lib.einsum('kdc,ikdc->i',t2_1[kk,kshift,kd]
-                                      [:,orb,:,:].conj(), t2_1[ki,kk,kd], optimize=True)
-                T1 -= 0.25*lib.einsum('kcd,ikdc->i',t2_1[kk,kshift,kc]
-                                      [:,orb,:,:].conj(), t2_1[ki,kk,kd], optimize=True)
-                T1 -= 0.25*lib.einsum('kdc,ikcd->i',t2_1[kk,kshift,kd]
-                                      [:,orb,:,:].conj(), t2_1[ki,kk,kc], optimize=True)
-                T1 += 0.25*lib.einsum('kcd,ikcd->i',t2_1[kk,kshift,kc]
-                                      [:,orb,:,:].conj(), t2_1[ki,kk,kc], optimize=True)
-                T1 -= 0.25*lib.einsum('kdc,ikdc->i',t2_1[kshift,kk,kd]
-                                      [orb,:,:,:].conj(), t2_1[ki,kk,kd], optimize=True)
-                T1 -= 0.25*lib.einsum('kcd,ikcd->i',t2_1[kshift,kk,kc]
-                                      [orb,:,:,:].conj(), t2_1[ki,kk,kc], optimize=True)
-    else :
-        if (adc.approx_trans_moments is False or adc.method == "adc(3)"):
-            t1_2 = adc.t1[0]
-            T1 += t1_2[kshift][:,(orb-nocc)]
+    if (adc.approx_trans_moments is False or adc.method == "adc(3)"):
+        t1_2 = adc.t1[0]
+        T1_vir += t1_2[kshift].T
 
 ######## ADC(2) 2h-1p  part  ############################################
 
-        for ki in range(nkpts):
-            for kj in range(nkpts):
-                ka = adc.khelper.kconserv[kj, kshift, ki]
-
-                t2_1_t = -t2_1[ki,kj,ka].transpose(2,3,1,0)
-                T2[ka,kj] += t2_1_t[:,(orb-nocc),:,:].conj()
+    for ki in range(nkpts):
+        for kj in range(nkpts):
+            ka = kconserv[kj, kshift, ki]
+            T2_vir[:,ka,kj] -= t2_1[ki,kj,ka].transpose(3,2,1,0).conj()
 
-        del t2_1_t
 ####### ADC(3) 2h-1p  part  ############################################
 
     if (adc.method == "adc(2)-x" and adc.approx_trans_moments is False) or (adc.method == "adc(3)"):
 
         t2_2 = adc.t2[1]
 
-        if orb >= nocc:
-            for ki in range(nkpts):
-                for kj in range(nkpts):
-                    ka = adc.khelper.kconserv[kj, kshift, ki]
-
-                    t2_2_t = -t2_2[ki,kj,ka].transpose(2,3,1,0)
-                    T2[ka,kj] += t2_2_t[:,(orb-nocc),:,:].conj()
-
+        for ki in range(nkpts):
+            for kj in range(nkpts):
+                ka = kconserv[kj, kshift, ki]
+                T2_vir[:,ka,kj] -= t2_2[ki,kj,ka].transpose(3,2,1,0).conj()
 
 ######### ADC(3) 1h part  ############################################
 
     if(method=='adc(3)'):
-        if orb < nocc:
-            for kk in range(nkpts):
-                for kc in range(nkpts):
-                    kd = adc.khelper.kconserv[kk, kc, kshift]
-                    ki = adc.khelper.kconserv[kd, kk, kc]
-                    T1 += 0.25* \
-                        lib.einsum('kdc,ikdc->i',t2_1[kk,ki,kd][:,orb,
-                                   :,:].conj(), t2_2[ki,kk,kd], optimize=True)
-                    T1 -= 0.25* \
-                        lib.einsum('kcd,ikdc->i',t2_1[kk,ki,kc][:,orb,
-                                   :,:].conj(), t2_2[ki,kk,kd], optimize=True)
-                    T1 -= 0.25* \
-                        lib.einsum('kdc,ikcd->i',t2_1[kk,ki,kd][:,orb,
-                                   :,:].conj(), t2_2[ki,kk,kc], optimize=True)
-                    T1 += 0.25* \
-                        lib.einsum('kcd,ikcd->i',t2_1[kk,ki,kc][:,orb,
-                                   :,:].conj(), t2_2[ki,kk,kc], optimize=True)
-                    T1 -= 0.25* \
-                        lib.einsum('kdc,ikdc->i',t2_1[ki,kk,kd][orb,:,
-                                   :,:].conj(), t2_2[ki,kk,kd], optimize=True)
-                    T1 -= 0.25* \
-                        lib.einsum('kcd,ikcd->i',t2_1[ki,kk,kc][orb,:,
-                                   :,:].conj(), t2_2[ki,kk,kc], optimize=True)
-
-                    T1 += 0.25* \
-                        lib.einsum('ikdc,kdc->i',t2_1[ki,kk,kd],
-                                   t2_2[kk,ki,kd][:,orb,:,:].conj(),optimize=True)
-                    T1 -= 0.25* \
-                        lib.einsum('ikcd,kdc->i',t2_1[ki,kk,kc],
-                                   t2_2[kk,ki,kd][:,orb,:,:].conj(),optimize=True)
-                    T1 -= 0.25* \
-                        lib.einsum('ikdc,kcd->i',t2_1[ki,kk,kd],
-                                   t2_2[kk,ki,kc][:,orb,:,:].conj(),optimize=True)
-                    T1 += 0.25* \
-                        lib.einsum('ikcd,kcd->i',t2_1[ki,kk,kc],
-                                   t2_2[kk,ki,kc][:,orb,:,:].conj(),optimize=True)
-                    T1 -= 0.25* \
-                        lib.einsum('ikcd,kcd->i',t2_1[ki,kk,kc],
-                                   t2_2[ki,kk,kc][orb,:,:,:].conj(),optimize=True)
-                    T1 -= 0.25* \
-                        lib.einsum('ikdc,kdc->i',t2_1[ki,kk,kd],
-                                   t2_2[ki,kk,kd][orb,:,:,:].conj(),optimize=True)
-        else:
+        for kk in range(nkpts):
+            for kc in range(nkpts):
+                ki = kconserv[kshift,kk,kc]
 
-            for kk in range(nkpts):
-                for kc in range(nkpts):
-                    ki = adc.khelper.kconserv[kshift,kk,kc]
+                T1_vir += 0.5*lib.einsum('kicp,kc->pi',t2_1[kk,ki,kc], t1_2[kk],optimize=True)
+                T1_vir -= 0.5*lib.einsum('ikcp,kc->pi',t2_1[ki,kk,kc], t1_2[kk],optimize=True)
+                T1_vir += 0.5*lib.einsum('kicp,kc->pi',t2_1[kk,ki,kc], t1_2[kk],optimize=True)
 
-                    T1 += 0.5 * lib.einsum('kic,kc->i',
-                                           t2_1[kk,ki,kc][:,:,:,(orb-nocc)], t1_2[kk],optimize=True)
-                    T1 -= 0.5*lib.einsum('ikc,kc->i',t2_1[ki,kk,kc]
-                                         [:,:,:,(orb-nocc)], t1_2[kk],optimize=True)
-                    T1 += 0.5*lib.einsum('kic,kc->i',t2_1[kk,ki,kc]
-                                         [:,:,:,(orb-nocc)], t1_2[kk],optimize=True)
+    # T2_vir[ka,kj] <- 2*T2_vir[ka,kj] - T2_vir[ka,ki]^T, with ki fixed by
+    # momentum conservation; all blocks are updated from the unmodified T2_vir
+    ka, kj = np.indices((nkpts,nkpts))
+    ki = kconserv[ka,kj,kshift]
+    T2_vir = 2.*T2_vir - T2_vir[:,ka,ki].transpose(0,1,2,3,5,4)
 
-        del t2_2
-    del t2_1
+    return T1_vir, T2_vir
 
-    for ki in range(nkpts):
-        for kj in range(nkpts):
-            ka = adc.khelper.kconserv[kj,kshift, ki]
-            T2[ka,kj] += T2[ka,kj] - T2[ka,ki].transpose(0,2,1)
 
-    T2 = T2.reshape(-1)
-    T = np.hstack((T1,T2))
+def get_trans_moments(adc,kshift):
+
+    if adc.method not in ("adc(2)", "adc(2)-x", "adc(3)"):
+        raise NotImplementedError(adc.method)
+
+    nocc = adc.nocc
+    nvir = adc.nmo - adc.nocc
+    nmo = adc.nmo
+
+    T1_occ = _trans_moments_occ(adc, kshift)
+    T1_vir, T2_vir = _trans_moments_vir(adc, kshift)
+
+    # Rows run over the MOs, occupied ones first; the occupied orbitals have
+    # no 2h-1p moments
+    T = np.zeros((nmo,nocc+T2_vir[0].size), dtype=np.complex128)
+    T[:nocc,:nocc] = T1_occ
+    T[nocc:,:nocc] = T1_vir
+    T[nocc:,nocc:] = T2_vir.reshape(nvir,-1)
 
     return T
 
@@ -903,21 +925,24 @@ def get_trans_moments_orbital(adc, orb, kshift):
 def renormalize_eigenvectors(adc, kshift, U, nroots=1):
 
     nkpts = adc.nkpts
+    kconserv = adc.khelper.kconserv
     nocc = adc.t2[0].shape[3]
     n_singles = nocc
     nvir = adc.nmo - adc.nocc
 
-    for I in range(U.shape[1]):
-        U1 = U[:n_singles,I]
-        U2 = U[n_singles:,I].reshape(nkpts,nkpts,nvir,nocc,nocc)
-        UdotU = np.dot(U1.conj().ravel(),U1.ravel())
-        for kj in range(nkpts):
-            for kk in range(nkpts):
-                ka = adc.khelper.kconserv[kj, kshift, kk]
-                UdotU +=  2.*np.dot(U2[ka,kj].conj().ravel(), U2[ka,kj].ravel()) - \
-                                    np.dot(U2[ka,kj].conj().ravel(),
-                                           U2[ka,kk].transpose(0,2,1).ravel())
-        U[:,I] /= np.sqrt(UdotU)
+    # (ka,kj) runs over all k-point pairs as (kj,kk) does, so the k-point
+    # sums are done with a single gathered contraction
+    kj, kk = np.indices((nkpts,nkpts))
+    ka = kconserv[kj,kshift,kk]
+
+    # All roots are normalized together; the trailing index I of U2 runs
+    # over the roots
+    U1 = U[:n_singles]
+    U2 = U[n_singles:].reshape(nkpts,nkpts,nvir,nocc,nocc,-1)
+    UdotU = np.einsum('pI,pI->I', U1.conj(), U1)
+    UdotU += 2.*np.einsum('xypqrI,xypqrI->I', U2.conj(), U2)
+    UdotU -= np.einsum('xypqrI,xypqrI->I', U2[ka,kj].conj(), U2[ka,kk].transpose(0,1,2,4,3,5))
+    U /= np.sqrt(UdotU)
 
     U = U.reshape(-1,nroots)
 
@@ -1042,15 +1067,12 @@ class RADCIP(kadc_rhf.RADC):
             idx = np.argsort(diag)
         else:
             idx = np.argsort(diag)[::-1]
-        guess = np.zeros((diag.shape[0], nroots), dtype=dtype)
+        # Each guess vector is a unit vector on one of the lowest (or highest)
+        # diagonal elements; set those entries directly
         min_shape = min(diag.shape[0], nroots)
-        guess[:min_shape,:min_shape] = np.identity(min_shape)
-        g = np.zeros((diag.shape[0], nroots), dtype=dtype)
-        g[idx] = guess.copy()
-        guess = []
-        for p in range(g.shape[1]):
-            guess.append(g[:,p])
-        return guess
+        guess = np.zeros((nroots, diag.shape[0]), dtype=dtype)
+        guess[np.arange(min_shape), idx[:min_shape]] = 1.0
+        return list(guess)
 
     def gen_matvec(self,kshift,imds=None, eris=None):
         if imds is None:
@@ -19,6 +19,7 @@ import unittest
 import numpy
 from pyscf.pbc import gto
 from pyscf.pbc import scf,adc,mp
+from pyscf.pbc.adc import kadc_rhf_ea
 from pyscf import adc as mol_adc
 from pyscf.pbc.tools.pbc import super_cell
 
@@ -60,9 +61,9 @@ class KnownValues(unittest.TestCase):
         self.assertAlmostEqual(e[0][1], 1.29595017, 4)
         self.assertAlmostEqual(e[0][2], 1.68125009, 4)
 
-        self.assertAlmostEqual(p[0][0], 1.96030215, 4)
-        self.assertAlmostEqual(p[0][1], 0.00398257, 4)
-        self.assertAlmostEqual(p[0][2], 0.00000299, 4)
+        self.assertAlmostEqual(p[0][0], 1.96030165, 4)
+        self.assertAlmostEqual(p[0][1], 0.00398214, 4)
+        self.assertAlmostEqual(p[0][2], 0.00000581, 4)
 
     def test_ea_adc2x_k_high_cost(self):
 
@@ -79,9 +80,9 @@ class KnownValues(unittest.TestCase):
         self.assertAlmostEqual(e[0][1], 1.38987893, 4)
         self.assertAlmostEqual(e[0][2], 1.38987895, 4)
 
-        self.assertAlmostEqual(p[0][0], 1.95209795, 4)
-        self.assertAlmostEqual(p[0][1], 0.00000001, 4)
-        self.assertAlmostEqual(p[0][2], 0.00000002, 4)
+        self.assertAlmostEqual(p[0][0], 1.95209783, 4)
+        self.assertAlmostEqual(p[0][1], 0.00000000, 4)
+        self.assertAlmostEqual(p[0][2], 0.00000000, 4)
 
     def test_ea_adc3_k_skip(self):
 
@@ -96,6 +97,35 @@ class KnownValues(unittest.TestCase):
         self.assertAlmostEqual(p[0][1], 0.00111690, 4)
         self.assertAlmostEqual(p[0][2], 0.00385444, 4)
 
+    def test_ea_trans_moments_k(self):
+
+        kadc.method = 'adc(2)'
+        kadc.kernel_gs()
+        myadc = kadc_rhf_ea.RADCEA(kadc)
+
+        nkpts = kadc.nkpts
+        nocc = kadc.nocc
+        nvir = kadc.nmo - kadc.nocc
+        kconserv = kadc.khelper.kconserv
+        kshift = 0
+
+        # Unsymmetrized ADC(2) 2p-1h moments
+        t2_1 = kadc.t2[0]
+        T2 = numpy.zeros((nocc,nkpts,nkpts,nocc,nvir,nvir), dtype=numpy.complex128)
+        for kj in range(nkpts):
+            for ka in range(nkpts):
+                kb = kconserv[kj, ka, kshift]
+                ki = kconserv[ka, kj, kb]
+                T2[:,kj,ka] = -t2_1[ki,kj,ka].conj()
+
+        T = kadc_rhf_ea.get_trans_moments(myadc, kshift)
+        T2_sym = T[:nocc,nvir:].reshape(T2.shape)
+        for ki in range(nkpts):
+            for ka in range(nkpts):
+                kb = kconserv[ki, ka, kshift]
+                ref = 2. * T2[:,ki,ka] - T2[:,ki,kb].transpose(0,1,3,2)
+                self.assertAlmostEqual(abs(T2_sym[:,ki,ka] - ref).max(), 0, 12)
+
 if __name__ == "__main__":
     print("k-point calculations for EA-ADC methods")
     unittest.main()
@@ -19,6 +19,7 @@ import unittest
 import numpy
 from pyscf.pbc import gto
 from pyscf.pbc import scf,adc,mp
+from pyscf.pbc.adc import kadc_rhf_ip
 from pyscf import adc as mol_adc
 from pyscf.pbc.tools.pbc import super_cell
 
@@ -59,9 +60,9 @@ class KnownValues(unittest.TestCase):
         self.assertAlmostEqual(e[0][1], 0.52088413, 4)
         self.assertAlmostEqual(e[0][2], 0.92916398, 4)
 
-        self.assertAlmostEqual(p[0][0], 1.89132918, 4)
-        self.assertAlmostEqual(p[0][1], 1.80157487, 4)
-        self.assertAlmostEqual(p[0][2], 0.00004972, 4)
+        self.assertAlmostEqual(p[0][0], 1.89132794, 4)
+        self.assertAlmostEqual(p[0][1], 1.80161227, 4)
+        self.assertAlmostEqual(p[0][2], 0.00005003, 4)
 
     def test_ip_adc2x_k_high_cost(self):
 
@@ -77,9 +78,9 @@ class KnownValues(unittest.TestCase):
         self.assertAlmostEqual(e[0][1], 0.65279043, 4)
         self.assertAlmostEqual(e[0][2], 1.08236251, 4)
 
-        self.assertAlmostEqual(p[0][0], 1.93375487, 4)
-        self.assertAlmostEqual(p[0][1], 1.90733872, 4)
-        self.assertAlmostEqual(p[0][2], 0.00357151, 4)
+        self.assertAlmostEqual(p[0][0], 1.93375504, 4)
+        self.assertAlmostEqual(p[0][1], 1.90734443, 4)
+        self.assertAlmostEqual(p[0][2], 0.00357072, 4)
 
     def test_ip_adc3_k(self):
 
@@ -92,9 +93,37 @@ class KnownValues(unittest.TestCase):
         self.assertAlmostEqual(e[0][1], 0.52724032, 4)
         self.assertAlmostEqual(e[0][2], 0.85718537, 4)
 
-        self.assertAlmostEqual(p[0][0], 1.90849228, 4)
-        self.assertAlmostEqual(p[0][1], 1.80306363, 4)
-        self.assertAlmostEqual(p[0][2], 0.00578080, 4)
+        self.assertAlmostEqual(p[0][0], 1.90849146, 4)
+        self.assertAlmostEqual(p[0][1], 1.80308418, 4)
+        self.assertAlmostEqual(p[0][2], 0.00578095, 4)
+
+    def test_ip_trans_moments_k(self):
+
+        kadc.method = 'adc(2)'
+        kadc.kernel_gs()
+        myadc = kadc_rhf_ip.RADCIP(kadc)
+
+        nkpts = kadc.nkpts
+        nocc = kadc.nocc
+        nvir = kadc.nmo - kadc.nocc
+        kconserv = kadc.khelper.kconserv
+        kshift = 0
+
+        # Unsymmetrized ADC(2) 2h-1p moments
+        t2_1 = kadc.t2[0]
+        T2 = numpy.zeros((nvir,nkpts,nkpts,nvir,nocc,nocc), dtype=numpy.complex128)
+        for ki in range(nkpts):
+            for kj in range(nkpts):
+                ka = kconserv[kj, kshift, ki]
+                T2[:,ka,kj] = -t2_1[ki,kj,ka].transpose(3,2,1,0).conj()
+
+        T = kadc_rhf_ip.get_trans_moments(myadc, kshift)
+        T2_sym = T[nocc:,nocc:].reshape(T2.shape)
+        for ka in range(nkpts):
+            for kj in range(nkpts):
+                ki = kconserv[ka, kj, kshift]
+                ref = 2. * T2[:,ka,kj] - T2[:,ka,ki].transpose(0,1,3,2)
+                self.assertAlmostEqual(abs(T2_sym[:,ka,kj] - ref).max(), 0, 12)
 
 if __name__ == "__main__":
     print("k-point calculations for IP-ADC methods")